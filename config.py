@@ -6,4 +6,4 @@ RESULTS_FILENAME = "typing_results.txt"
 DEFAULT_WORD_LIST_FOLDER = "word_lists"
 
 ESCAPE_KEY = 27
-BACKSPACE_CODES = [curses.KEY_BACKSPACE, 127, 8, ord("\b")]
+BACKSPACE_CODES = frozenset({curses.KEY_BACKSPACE, 127, 8})
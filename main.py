@@ -1,5 +1,6 @@
 import curses
 from curses import wrapper
+import logging
 import os
 import traceback
 
@@ -8,6 +9,8 @@ from config import RESULTS_FILENAME, USE_API_LOADER, DEFAULT_WORD_LIST_FOLDER
 from text_loader import ApiWordLoader, LocalFolderWordLoader
 from typing_test import TypingTest
 
+log = logging.getLogger(__name__)
+
 
 def main(stdscr):
     curses.curs_set(0)
@@ -15,7 +18,7 @@ def main(stdscr):
 
     try:
         if USE_API_LOADER:
-            print("Config set to use API Loader.")
+            log.debug("Config set to use API Loader.")
             loader = ApiWordLoader()
             if not loader.all_words:
                 raise RuntimeError(
@@ -24,7 +27,7 @@ def main(stdscr):
 
         else:
             folder_path = DEFAULT_WORD_LIST_FOLDER
-            print(f"Config set to use Local Folder Loader ('{folder_path}').")
+            log.debug("Config set to use Local Folder Loader ('%s').", folder_path)
 
             if not os.path.isdir(folder_path):
                 raise FileNotFoundError(
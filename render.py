@@ -0,0 +1,78 @@
+"""Cell painting for the typing screen.
+
+This module holds no TypingTest state and is fully annotated so it can be
+compiled with mypyc (``mypyc render.py``); the compiled extension is then
+imported under the same name, and the plain module is used otherwise.
+"""
+
+import curses
+
+CORRECT_PAIR = 1
+INCORRECT_PAIR = 2
+PENDING_PAIR = 3
+
+
+def build_layout(
+    cells: int, start_row: int, max_y: int, max_x: int
+) -> tuple[list[int], list[int], list[int]]:
+    """Returns the screen row, column and row-end index of each visible cell.
+
+    The target and screen size are fixed between resizes, so the wrap math is
+    done once here and paint_text only indexes these lists. Cells that fall
+    below the bottom of the screen are left out.
+    """
+    visible = max(0, min(cells, (max_y - start_row) * max_x))
+    rows: list[int] = []
+    cols: list[int] = []
+    row_ends: list[int] = []
+    for i in range(visible):
+        row, col = divmod(i, max_x)
+        rows.append(row + start_row)
+        cols.append(col)
+        row_ends.append(min(visible, i + max_x - col))
+    return rows, cols, row_ends
+
+
+def paint_text(
+    stdscr,
+    target: bytes,
+    typed: bytearray,
+    correct: bytearray,
+    typed_len: int,
+    start: int,
+    stop: int,
+    layout: tuple[list[int], list[int], list[int]],
+    attrs: list[int],
+) -> None:
+    """Paints target cells [start, stop), showing typed chars where present.
+
+    ``correct`` holds 1 for each typed cell that matched the target and 0
+    otherwise, so colors come from a byte lookup instead of a comparison.
+    ``layout`` comes from build_layout(). Consecutive cells on one row with
+    the same color are drawn with a single addnstr() call; ``attrs`` maps a
+    color pair number to its attribute.
+    """
+    rows, cols, row_ends = layout
+    # Only a write ending in the bottom-right cell raises (curses cannot
+    # advance the cursor past it), and that is always the last run.
+    stop = min(stop, len(rows))
+    i = start
+    try:
+        while i < stop:
+            row_stop = min(stop, row_ends[i])
+            if i < typed_len:
+                typed_stop = min(row_stop, typed_len)
+                ok = correct[i]
+                end = i + 1
+                while end < typed_stop and correct[end] == ok:
+                    end += 1
+                text = typed[i:end].decode("ascii", "replace")
+                pair = CORRECT_PAIR if ok else INCORRECT_PAIR
+            else:
+                end = row_stop
+                text = target[i:end].decode("ascii", "replace")
+                pair = PENDING_PAIR
+            stdscr.addnstr(rows[i], cols[i], text, end - i, attrs[pair])
+            i = end
+    except curses.error:
+        pass
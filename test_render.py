@@ -0,0 +1,76 @@
+import curses
+import unittest
+from unittest.mock import Mock, call
+
+from render import build_layout, paint_text
+
+
+def marks(typed: bytes, target: bytes) -> bytearray:
+    """Build the correctness bitmap the key handler keeps for typed cells."""
+    return bytearray(int(a == b) for a, b in zip(typed, target))
+
+
+class TestPaintText(unittest.TestCase):
+    """Tests for painting typing screen cells."""
+
+    def setUp(self):
+        """Use a mock screen and fake color pair attributes."""
+        self.stdscr = Mock()
+        self.attrs = [0, 100, 200, 300]
+
+    def test_colors_typed_and_pending_cells(self):
+        """Test correct, incorrect and untyped cells get their color pairs."""
+        typed = bytearray(b"cx")
+        ok = marks(typed, b"cat")
+        layout = build_layout(3, 3, 10, 10)
+        paint_text(self.stdscr, b"cat", typed, ok, 2, 0, 3, layout, self.attrs)
+        self.stdscr.addnstr.assert_has_calls(
+            [call(3, 0, "c", 1, 100), call(3, 1, "x", 1, 200), call(3, 2, "t", 1, 300)]
+        )
+
+    def test_batches_same_color_runs(self):
+        """Test runs of one color on a row are drawn in a single call."""
+        target = b"hello world"
+        typed = bytearray(b"hexlo")
+        ok = marks(typed, target)
+        layout = build_layout(11, 0, 5, 80)
+        paint_text(self.stdscr, target, typed, ok, 5, 0, 11, layout, self.attrs)
+        self.assertEqual(
+            self.stdscr.addnstr.call_args_list,
+            [
+                call(0, 0, "he", 2, 100),
+                call(0, 2, "x", 1, 200),
+                call(0, 3, "lo", 2, 100),
+                call(0, 5, " world", 6, 300),
+            ],
+        )
+
+    def test_wraps_and_stops_at_screen_bottom(self):
+        """Test cells wrap at max_x and rows past max_y are skipped."""
+        empty = bytearray()
+        layout = build_layout(6, 0, 2, 2)
+        paint_text(self.stdscr, b"abcdef", empty, empty, 0, 1, 6, layout, self.attrs)
+        self.assertEqual(
+            [c.args[:3] for c in self.stdscr.addnstr.call_args_list],
+            [(0, 1, "b"), (1, 0, "cd")],
+        )
+
+    def test_layout_wraps_rows_and_drops_offscreen_cells(self):
+        """Test the layout offsets rows, wraps at max_x and stops at max_y."""
+        rows, cols, row_ends = build_layout(7, 1, 3, 3)
+        self.assertEqual(rows, [1, 1, 1, 2, 2, 2])
+        self.assertEqual(cols, [0, 1, 2, 0, 1, 2])
+        self.assertEqual(row_ends, [3, 3, 3, 6, 6, 6])
+
+    def test_bottom_right_error_is_swallowed(self):
+        """Test the curses error from writing the last screen cell is ignored."""
+        self.stdscr.addnstr.side_effect = [None, curses.error()]
+        typed = bytearray(b"ab")
+        ok = marks(typed, b"abcd")
+        layout = build_layout(4, 0, 2, 2)
+        paint_text(self.stdscr, b"abcd", typed, ok, 2, 0, 4, layout, self.attrs)
+        self.assertEqual(self.stdscr.addnstr.call_count, 2)
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -1,16 +1,21 @@
+import os
+import tempfile
 import unittest
-from unittest.mock import patch
+from unittest.mock import Mock, patch
 
-from text_loader import LocalFolderWordLoader
-
-DUMMY_FOLDER_PATH = "dummy_test_words"
+from text_loader import (
+    ApiWordLoader,
+    LocalFolderWordLoader,
+    WORD_CACHE_FILENAME,
+    WORD_FILES,
+)
 
 
 class TestLocalFolderWordLoader(unittest.TestCase):
     """Tests for the LocalFolderWordLoader class."""
 
     def setUp(self):
-        """Set up sample word data and mock file reading."""
+        """Set up sample word data in a temporary word list folder."""
         self.sample_words = {
             "easy": ["cat", "dog", "sun", "run", "fly", "car"],
             "medium": [
@@ -34,15 +39,14 @@ class TestLocalFolderWordLoader(unittest.TestCase):
             ],
         }
 
-        patcher = patch("text_loader.LocalFolderWordLoader._read_words_from_files")
-
-        self.mock_read_files = patcher.start()
-
-        self.mock_read_files.return_value = self.sample_words
+        self.temp_dir = tempfile.TemporaryDirectory()
+        self.addCleanup(self.temp_dir.cleanup)
+        for level, words in self.sample_words.items():
+            file_path = os.path.join(self.temp_dir.name, WORD_FILES[level])
+            with open(file_path, "w", encoding="utf-8") as f:
+                f.write("\n".join(words) + "\n")
 
-        self.addCleanup(patcher.stop)
-
-        self.loader = LocalFolderWordLoader(folder_path=DUMMY_FOLDER_PATH)
+        self.loader = LocalFolderWordLoader(folder_path=self.temp_dir.name)
 
     def test_load_specific_difficulty_correct_count(self):
         """Test loading a specific number of words for a standard difficulty."""
@@ -85,20 +89,163 @@ class TestLocalFolderWordLoader(unittest.TestCase):
         )
 
     def test_load_invalid_difficulty(self):
-        """Test loading with a difficulty level that has no *mocked* words."""
+        """Test loading with a difficulty level that has no word file."""
 
         self.loader.set_options(difficulty="nonexistent", word_count=5)
         loaded_text = self.loader.load()
         self.assertEqual(loaded_text, "")
 
     def test_load_random_difficulty_empty_source(self):
-        """Test 'random' difficulty when source lists are empty by overwriting mock."""
+        """Test 'random' difficulty when source lists are empty by overwriting them."""
 
         self.loader.words_by_difficulty = {"easy": [], "medium": [], "hard": []}
         self.loader.set_options(difficulty="random", word_count=5)
         loaded_text = self.loader.load()
         self.assertEqual(loaded_text, "")
 
+    def test_words_sorted_and_deduplicated(self):
+        """Test word files are read into a sorted list without duplicates."""
+        file_path = os.path.join(self.temp_dir.name, WORD_FILES["easy"])
+        with open(file_path, "w", encoding="utf-8") as f:
+            f.write("sun\nCat\ndog\ncat\nsun\n")
+        self.assertEqual(self.loader._get_words("easy"), [b"cat", b"dog", b"sun"])
+
+    def test_large_pool_sampled_with_numpy(self):
+        """Test pools above NUMPY_SAMPLE_MIN use the numpy generator if present."""
+        mock_rng = Mock()
+        mock_rng.choice.return_value.tolist.return_value = [2, 0]
+        with patch("text_loader._rng", mock_rng), patch(
+            "text_loader.NUMPY_SAMPLE_MIN", 3
+        ):
+            text = self.loader._sample_text([b"cat", b"dog", b"sun"], 2)
+        mock_rng.choice.assert_called_once_with(3, size=2, replace=False)
+        self.assertEqual(text, "sun cat")
+
+    def test_scratch_buffer_grows_and_is_reused(self):
+        """Test the output buffer grows for long texts and is kept between loads."""
+        self.loader._scratch = bytearray(2)
+        self.loader.set_options(difficulty="hard", word_count=8)
+        loaded_words = self.loader.load().split()
+        self.assertCountEqual(loaded_words, self.sample_words["hard"])
+        scratch = self.loader._scratch
+        self.assertGreater(len(scratch), 2)
+
+        self.loader.set_options(difficulty="easy", word_count=2)
+        self.assertEqual(len(self.loader.load().split()), 2)
+        self.assertIs(self.loader._scratch, scratch)
+
+    def test_random_combined_list_cached(self):
+        """Test the combined 'random' list is built once and reset on reassignment."""
+        self.loader.set_options(difficulty="random", word_count=3)
+        self.loader.load()
+        combined = self.loader._combined_cache
+        self.assertEqual(len(combined), 21)
+        self.loader.load()
+        self.assertIs(self.loader._combined_cache, combined)
+
+        self.loader.words_by_difficulty = {"easy": [b"cat"], "medium": [], "hard": []}
+        self.assertIsNone(self.loader._combined_cache)
+        self.assertEqual(self.loader.load(), "cat")
+
+
+class TestWordCache(unittest.TestCase):
+    """Tests for the pickled word list cache of LocalFolderWordLoader."""
+
+    def setUp(self):
+        """Create a temporary word list folder."""
+        self.temp_dir = tempfile.TemporaryDirectory()
+        self.addCleanup(self.temp_dir.cleanup)
+        self.folder = self.temp_dir.name
+        self._write("easy.txt", "cat\ndog\n")
+        self._write("medium.txt", "python\n")
+        self._write("hard.txt", "algorithm\n")
+
+    def _write(self, filename: str, content: str):
+        with open(os.path.join(self.folder, filename), "w", encoding="utf-8") as f:
+            f.write(content)
+
+    def test_lazy_loading(self):
+        """Test word files are only read when their difficulty is used."""
+        loader = LocalFolderWordLoader(folder_path=self.folder)
+        self.assertEqual(
+            loader.words_by_difficulty, {"easy": None, "medium": None, "hard": None}
+        )
+        loader.set_options(difficulty="easy", word_count=2)
+        loader.load()
+        self.assertCountEqual(loader.words_by_difficulty["easy"], [b"cat", b"dog"])
+        self.assertIsNone(loader.words_by_difficulty["hard"])
+
+    def test_missing_folder_raises(self):
+        """Test a folder without any word files is rejected up front."""
+        with self.assertRaises(FileNotFoundError):
+            LocalFolderWordLoader(folder_path=os.path.join(self.folder, "missing"))
+
+    def test_cache_written_and_reused(self):
+        """Test a second loader reads the cache instead of the word files."""
+        first = LocalFolderWordLoader(folder_path=self.folder)
+        first_words = first._get_words("easy")
+        self.assertTrue(os.path.exists(os.path.join(self.folder, WORD_CACHE_FILENAME)))
+
+        second = LocalFolderWordLoader(folder_path=self.folder)
+        with patch.object(LocalFolderWordLoader, "_read_word_file") as mock_read:
+            self.assertEqual(second._get_words("easy"), first_words)
+            mock_read.assert_not_called()
+
+    def test_cache_invalidated_when_file_changes(self):
+        """Test a changed word file is re-read instead of served from cache."""
+        LocalFolderWordLoader(folder_path=self.folder)._get_words("easy")
+        self._write("easy.txt", "cat\ndog\nsun\n")
+        loader = LocalFolderWordLoader(folder_path=self.folder)
+        self.assertCountEqual(loader._get_words("easy"), [b"cat", b"dog", b"sun"])
+
+    def test_corrupt_cache_falls_back_to_files(self):
+        """Test an unreadable cache file is ignored."""
+        self._write(WORD_CACHE_FILENAME, "not a pickle")
+        loader = LocalFolderWordLoader(folder_path=self.folder)
+        self.assertEqual(loader._get_words("medium"), [b"python"])
+
+
+class TestApiWordLoader(unittest.TestCase):
+    """Tests for the ApiWordLoader class with the API request mocked out."""
+
+    def setUp(self):
+        """Serve a fixed word list instead of calling the API."""
+        self.api_words = [b"cat", b"tree", b"python", b"keyboard", b"algorithm", b"ox"]
+        patcher = patch(
+            "text_loader.ApiWordLoader._fetch_words", return_value=self.api_words
+        )
+        patcher.start()
+        self.addCleanup(patcher.stop)
+        self.loader = ApiWordLoader()
+
+    def test_difficulty_buckets(self):
+        """Test words are bucketed by length once, at construction."""
+        self.loader.set_options(difficulty="easy", word_count=5)
+        self.assertCountEqual(self.loader.load().split(), ["cat", "tree"])
+        self.loader.set_options(difficulty="medium", word_count=5)
+        self.assertEqual(self.loader.load(), "python")
+        self.loader.set_options(difficulty="hard", word_count=5)
+        self.assertCountEqual(self.loader.load().split(), ["keyboard", "algorithm"])
+
+    def test_random_uses_all_words(self):
+        """Test 'random' samples from every fetched word."""
+        self.loader.set_options(difficulty="random", word_count=10)
+        self.assertCountEqual(self.loader.load().encode().split(), self.api_words)
+
+
+class TestApiFetch(unittest.TestCase):
+    """Tests for parsing the API response in ApiWordLoader."""
+
+    @patch("text_loader.orjson", None)
+    @patch("text_loader.requests.get")
+    def test_fetch_words_dedupes_in_order(self, mock_get):
+        """Test fetched words are lower-cased, filtered and deduped in order."""
+        mock_get.return_value = Mock(
+            json=Mock(return_value=["Tree", "cat", "tree", "r2d2", 7, "Café", "ox"])
+        )
+        loader = ApiWordLoader()
+        self.assertEqual(loader.all_words, [b"tree", b"cat", b"ox"])
+
 
 if __name__ == "__main__":
     unittest.main()
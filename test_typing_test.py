@@ -1,5 +1,8 @@
+import curses
+import os
+import tempfile
 import unittest
-from unittest.mock import Mock
+from unittest.mock import Mock, patch
 
 from typing_test import TypingTest
 from text_loader import TextLoader
@@ -20,58 +23,47 @@ class TestTypingTestLogic(unittest.TestCase):
         self.test_instance = TypingTest(self.mock_stdscr, self.mock_loader)
         self.test_instance.target_text = self.test_text
 
-        self.test_instance.current_text = []
+        self.test_instance._target_bytes = self.test_text.encode("ascii")
+
+        self.test_instance._typed = bytearray(len(self.test_text))
+        self.test_instance._correct = bytearray(len(self.test_text))
+        self.test_instance._typed_len = 0
         self.test_instance.errors = 0
         self.test_instance.has_started_typing = False
 
-    def simulate_typing(self, chars_to_type: list):
-
-        if not self.test_instance.has_started_typing and chars_to_type:
-            self.test_instance.has_started_typing = True
+    def typed_text(self) -> str:
+        """Return the live part of the typed buffer as a string."""
+        inst = self.test_instance
+        return inst._typed[: inst._typed_len].decode()
 
+    def simulate_typing(self, chars_to_type: list):
+        """Feed characters and key codes through the real key handler."""
         for char_or_code in chars_to_type:
-            current_len = len(self.test_instance.current_text)
-
-            if char_or_code in BACKSPACE_CODES:
-                if self.test_instance.current_text:
-                    removed_idx = current_len - 1
-                    if (
-                        removed_idx < len(self.test_instance.target_text)
-                        and self.test_instance.current_text[removed_idx]
-                        != self.test_instance.target_text[removed_idx]
-                    ):
-                        self.test_instance.errors = max(
-                            0, self.test_instance.errors - 1
-                        )
-                    self.test_instance.current_text.pop()
-            elif isinstance(char_or_code, str):
-                if current_len < len(self.test_instance.target_text):
-                    target_char = self.test_instance.target_text[current_len]
-                    if char_or_code != target_char:
-                        self.test_instance.errors += 1
-                    self.test_instance.current_text.append(char_or_code)
+            if isinstance(char_or_code, str):
+                char_or_code = ord(char_or_code)
+            self.test_instance._process_key(char_or_code)
 
     def test_no_errors_correct_typing(self):
         """Test error count remains 0 for correct typing."""
         self.simulate_typing(["h", "e", "l", "l", "o"])
         self.assertEqual(self.test_instance.errors, 0)
-        self.assertEqual("".join(self.test_instance.current_text), "hello")
+        self.assertEqual(self.typed_text(), "hello")
 
     def test_error_increment_incorrect_typing(self):
         """Test error count increments for incorrect characters."""
         self.simulate_typing(["h", "X", "l", "l", "Y"])
         self.assertEqual(self.test_instance.errors, 2)
-        self.assertEqual("".join(self.test_instance.current_text), "hXllY")
+        self.assertEqual(self.typed_text(), "hXllY")
 
     def test_backspace_corrects_error_count(self):
         """Test backspace removes error and decrements count."""
-        backspace = BACKSPACE_CODES[0]
+        backspace = curses.KEY_BACKSPACE
         self.simulate_typing(["h", "e", "X", backspace, "l", "l", "o"])
         self.assertEqual(self.test_instance.errors, 0)
-        self.assertEqual("".join(self.test_instance.current_text), "hello")
+        self.assertEqual(self.typed_text(), "hello")
 
     def test_backspace_does_not_affect_error_count_if_correct(self):
-        backspace = BACKSPACE_CODES[0]
+        backspace = curses.KEY_BACKSPACE
 
         self.simulate_typing(["h", "e", "l", backspace, "l"])
 
@@ -81,13 +73,13 @@ class TestTypingTestLogic(unittest.TestCase):
             "Error count should be 0",
         )
         self.assertEqual(
-            "".join(self.test_instance.current_text),
+            self.typed_text(),
             "hel",
             "Current text should be 'hel'",
         )
 
     def test_multiple_errors_and_backspaces(self):
-        backspace = BACKSPACE_CODES[0]
+        backspace = curses.KEY_BACKSPACE
         self.simulate_typing(
             [
                 "h",
@@ -106,7 +98,76 @@ class TestTypingTestLogic(unittest.TestCase):
             ]
         )
         self.assertEqual(self.test_instance.errors, 2)
-        self.assertEqual("".join(self.test_instance.current_text), "heXlo World")
+        self.assertEqual(self.typed_text(), "heXlo World")
+
+    def test_backspace_codes_are_equivalent(self):
+        """Test every configured backspace code removes a character."""
+        for backspace in BACKSPACE_CODES:
+            self.simulate_typing(["h", "X", backspace])
+            self.assertEqual(self.typed_text(), "h")
+            self.assertEqual(self.test_instance.errors, 0)
+            self.simulate_typing([backspace])
+
+    def test_non_text_keys_are_ignored(self):
+        """Test function keys and out-of-range codes leave the state alone."""
+        self.simulate_typing(["h", curses.KEY_F1, curses.KEY_LEFT, 9, 100000])
+        self.assertEqual(self.typed_text(), "h")
+        self.assertEqual(self.test_instance.errors, 0)
+
+    def test_drain_applies_queued_keys(self):
+        """Test a paste burst is applied in one drain, stopping at empty input."""
+        self.mock_stdscr.getch.side_effect = [ord(c) for c in "ello"] + [-1]
+        self.test_instance._drain_input(ord("h"))
+        self.assertEqual(self.typed_text(), "hello")
+        self.assertEqual(self.mock_stdscr.getch.call_count, 5)
+
+    def test_drain_is_capped_at_passage_length(self):
+        """Test the drain reads at most one passage worth of keys per frame."""
+        backspace = curses.KEY_BACKSPACE
+        self.mock_stdscr.getch.side_effect = [ord("X"), backspace] * 50
+        self.test_instance._drain_input(ord("h"))
+        self.assertEqual(self.mock_stdscr.getch.call_count, len(self.test_text) - 1)
+
+    def test_resize_refreshes_cached_size(self):
+        """Test KEY_RESIZE re-reads the screen size and forces a full redraw."""
+        self.mock_stdscr.getmaxyx.return_value = (30, 100)
+        self.test_instance._rendered_len = 0
+        self.simulate_typing(["h", curses.KEY_RESIZE])
+        self.assertEqual(
+            (self.test_instance._max_y, self.test_instance._max_x), (30, 100)
+        )
+        self.assertIsNone(self.test_instance._rendered_len)
+        self.assertEqual(self.typed_text(), "h")
+
+
+class TestResultsFile(unittest.TestCase):
+    """Tests for appending results to the results file."""
+
+    def setUp(self):
+        """Point the results file at a temporary location."""
+        temp_dir = tempfile.TemporaryDirectory()
+        self.addCleanup(temp_dir.cleanup)
+        self.results_path = os.path.join(temp_dir.name, "results.txt")
+        patcher = patch("typing_test.RESULTS_FILENAME", self.results_path)
+        patcher.start()
+        self.addCleanup(patcher.stop)
+        self.test_instance = TypingTest(Mock(), Mock(spec=TextLoader))
+
+    def test_results_written_in_background(self):
+        """Test queued results share one writer and are complete on close."""
+        self.test_instance._save_results_to_file(60, 95.0, 12.5, 3)
+        writer = self.test_instance._results_writer
+        self.test_instance._save_results_to_file(70, 100.0, 9.0, 0)
+        self.assertIs(self.test_instance._results_writer, writer)
+
+        self.test_instance._close_results_file()
+        self.assertFalse(writer.is_alive())
+        self.assertIsNone(self.test_instance._results_file)
+        with open(self.results_path, encoding="utf-8") as f:
+            lines = f.read().splitlines()
+        self.assertEqual(len(lines), 2)
+        self.assertIn("WPM: 60, Accuracy: 95.0%, Errors: 3, Time: 12", lines[0])
+        self.assertIn("WPM: 70, Accuracy: 100.0%, Errors: 0, Time: 9", lines[1])
 
 
 if __name__ == "__main__":
@@ -1,5 +1,5 @@
 import unittest
-from utils import calculate_wpm, calculate_accuracy
+from utils import calculate_wpm, calculate_wpm_ns, calculate_accuracy
 
 
 class TestCalculations(unittest.TestCase):
@@ -11,6 +11,15 @@ class TestCalculations(unittest.TestCase):
         self.assertEqual(calculate_wpm(chars_typed=50, time_elapsed_seconds=0), 0)
         self.assertEqual(calculate_wpm(chars_typed=123, time_elapsed_seconds=25.5), 58)
 
+    def test_calculate_wpm_ns(self):
+        self.assertEqual(calculate_wpm_ns(chars_typed=100, elapsed_ns=30 * 10**9), 40)
+        self.assertEqual(calculate_wpm_ns(chars_typed=25, elapsed_ns=6 * 10**9), 50)
+        self.assertEqual(calculate_wpm_ns(chars_typed=0, elapsed_ns=10 * 10**9), 0)
+        self.assertEqual(calculate_wpm_ns(chars_typed=50, elapsed_ns=0), 0)
+        self.assertEqual(
+            calculate_wpm_ns(chars_typed=123, elapsed_ns=25_500 * 10**6), 58
+        )
+
     def test_calculate_accuracy(self):
 
         self.assertEqual(calculate_accuracy(target_len=100, errors=0), 100.0)
@@ -0,0 +1,52 @@
+import os
+import tempfile
+import unittest
+
+from text_loader import LocalFolderWordLoader, WORD_FILES
+from word_pack import WordPack, build_word_packs, pack_paths, write_word_pack
+
+
+class TestWordPack(unittest.TestCase):
+    """Tests for the binary word pack format."""
+
+    def setUp(self):
+        """Create a temporary folder for pack files."""
+        self.temp_dir = tempfile.TemporaryDirectory()
+        self.addCleanup(self.temp_dir.cleanup)
+        self.folder = self.temp_dir.name
+
+    def test_round_trip(self):
+        """Test words written to a pack are read back in order."""
+        words = [b"cat", b"python", b"algorithm"]
+        pack_path, index_path = pack_paths(self.folder, "easy")
+        self.assertEqual(write_word_pack(words, pack_path, index_path), 3)
+
+        pack = WordPack(pack_path, index_path)
+        self.addCleanup(pack.close)
+        self.assertEqual(len(pack), 3)
+        self.assertEqual(pack[1], b"python")
+        self.assertEqual(pack[-1], b"algorithm")
+        self.assertEqual(list(pack), words)
+
+    def test_empty_pack(self):
+        """Test an empty word list produces an empty, readable pack."""
+        pack_path, index_path = pack_paths(self.folder, "hard")
+        write_word_pack([], pack_path, index_path)
+        pack = WordPack(pack_path, index_path)
+        self.assertEqual(len(pack), 0)
+        self.assertFalse(pack)
+
+    def test_loader_prefers_packs(self):
+        """Test LocalFolderWordLoader reads packs built from the text files."""
+        for level, filename in WORD_FILES.items():
+            with open(os.path.join(self.folder, filename), "w") as f:
+                f.write(f"{level}\nword\n")
+        build_word_packs(self.folder, WORD_FILES)
+
+        loader = LocalFolderWordLoader(folder_path=self.folder)
+        self.assertIsInstance(loader._get_words("easy"), WordPack)
+        self.assertEqual(list(loader._get_words("medium")), [b"medium", b"word"])
+
+
+if __name__ == "__main__":
+    unittest.main()
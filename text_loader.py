@@ -1,15 +1,52 @@
 from abc import ABC, abstractmethod
+from concurrent.futures import ThreadPoolExecutor
+import logging
+import mmap
 import os
+import pickle
 import random
 import requests
 
+from word_pack import MAX_WORD_BYTES, WordPack, pack_paths
+
+try:
+    import orjson
+except ImportError:
+    orjson = None
+
+try:
+    import numpy as np
+except ImportError:
+    np = None
+
+log = logging.getLogger(__name__)
+_rng = np.random.default_rng() if np is not None else None
+
 API_URL = "https://random-word-api.vercel.app/api?words=50"
 
+# Word files larger than this are memory-mapped instead of read through a
+# buffered file object; below it the mmap setup costs more than it saves.
+MMAP_MIN_SIZE = 64 * 1024
+
+# Pools at least this large are sampled with numpy when it is installed.
+NUMPY_SAMPLE_MIN = 10_000
+
+WORD_FILES = {
+    "easy": "easy.txt",
+    "medium": "medium.txt",
+    "hard": "hard.txt",
+}
+WORD_CACHE_FILENAME = ".wordcache.pkl"
+# Bump when the pickled word list format changes so old caches are ignored.
+WORD_CACHE_VERSION = 2
+
 
 class TextLoader(ABC):
     def __init__(self, difficulty: str = "medium", word_count: int = 25):
         self.difficulty = difficulty
         self.word_count = word_count
+        # Reused output buffer for _sample_text; only ever grows.
+        self._scratch = bytearray(4096)
 
     @abstractmethod
     def load(self) -> str:
@@ -19,120 +56,157 @@ class TextLoader(ABC):
         self.difficulty = difficulty
         self.word_count = word_count
 
+    def _sample_text(self, word_list: list[bytes], count: int) -> str:
+        # Sampling indices keeps random.sample from copying the whole pool,
+        # and only the picked words are fetched. Words are stored as ASCII
+        # bytes and copied into the reused scratch buffer, so the text is
+        # decoded once at the end.
+        pool_size = len(word_list)
+        if _rng is not None and pool_size >= NUMPY_SAMPLE_MIN:
+            picks = _rng.choice(pool_size, size=count, replace=False).tolist()
+        else:
+            picks = random.sample(range(pool_size), count)
+        if not picks:
+            return ""
+        scratch = self._scratch
+        pos = 0
+        for i in picks:
+            word = word_list[i]
+            end = pos + len(word)
+            if end >= len(scratch):
+                scratch.extend(bytes(max(end + 1 - len(scratch), len(scratch))))
+            scratch[pos:end] = word
+            scratch[end] = 32  # b" "
+            pos = end + 1
+        with memoryview(scratch) as view:
+            return str(view[: pos - 1], "ascii")
+
 
 class ApiWordLoader(TextLoader):
+    # Inclusive word length range for each difficulty.
+    _RANGES = {"easy": (3, 4), "medium": (5, 7), "hard": (8, MAX_WORD_BYTES)}
+
     def __init__(self, difficulty: str = "medium", word_count: int = 25):
         super().__init__(difficulty, word_count)
-        print("Attempting to fetch words from API...")
+        log.debug("Attempting to fetch words from API...")
         self._fetched_from_api = False
-        self.all_words: list[str] | None = self._fetch_words()
+        self.all_words: list[bytes] | None = self._fetch_words()
         if not self.all_words:
-            print("Warning: API fetch failed. Using fallback list.")
+            log.warning("API fetch failed. Using fallback list.")
             self.all_words = self._get_fallback_words()
-            print(
-                f"Word source ready: Using Fallback list ({len(self.all_words)} words)."
-            )
+            source = "Fallback"
         else:
-            print(f"Word source ready: Using API list ({len(self.all_words)} words).")
+            source = "API"
+        log.debug(
+            "Word source ready: Using %s list (%d words).", source, len(self.all_words)
+        )
+        self._buckets = self._build_buckets(self.all_words)
 
-    def _fetch_words(self) -> list[str] | None:
+    def _fetch_words(self) -> list[bytes] | None:
         try:
             response = requests.get(API_URL, timeout=10)
             response.raise_for_status()
-            data = response.json()
-            word_list = None
+            if orjson is not None:
+                data = orjson.loads(response.content)
+            else:
+                data = response.json()
             if isinstance(data, list) and data:
-                word_list = data
-            if word_list:
-                unique_words = list(
-                    set(
-                        w.lower()
-                        for w in word_list
-                        if isinstance(w, str) and w.isalpha()
-                    )
-                )
+                seen = set()
+                unique_words = []
+                for w in data:
+                    if isinstance(w, str) and w.isascii() and w.isalpha():
+                        lw = w.lower().encode("ascii")
+                        if lw not in seen:
+                            seen.add(lw)
+                            unique_words.append(lw)
                 if unique_words:
                     self._fetched_from_api = True
                     return unique_words
-            print(f"  - Warning: API data not a valid list ({type(data)}).")
+            log.warning("API data not a valid list (%s).", type(data))
             return None
         except requests.exceptions.Timeout:
-            print("  - API request timed out.")
+            log.warning("API request timed out.")
             return None
         except requests.exceptions.RequestException as e:
-            print(f"  - API request failed: {e}")
+            log.warning("API request failed: %s", e)
             return None
         except Exception as e:
-            print(f"  - Error fetching words: {e}")
+            log.warning("Error fetching words: %s", e)
             return None
 
-    def _get_fallback_words(self) -> list[str]:
+    def _get_fallback_words(self) -> list[bytes]:
         return [
-            "the",
-            "quick",
-            "brown",
-            "fox",
-            "jumps",
-            "over",
-            "lazy",
-            "dog",
-            "python",
-            "coding",
-            "terminal",
-            "keyboard",
-            "practice",
-            "speed",
-            "accuracy",
-            "challenge",
-            "developer",
-            "language",
-            "program",
-            "function",
-            "variable",
-            "interface",
-            "exception",
-            "algorithm",
+            b"the",
+            b"quick",
+            b"brown",
+            b"fox",
+            b"jumps",
+            b"over",
+            b"lazy",
+            b"dog",
+            b"python",
+            b"coding",
+            b"terminal",
+            b"keyboard",
+            b"practice",
+            b"speed",
+            b"accuracy",
+            b"challenge",
+            b"developer",
+            b"language",
+            b"program",
+            b"function",
+            b"variable",
+            b"interface",
+            b"exception",
+            b"algorithm",
         ]
 
-    def _filter_words(self, word_list: list[str]) -> list[str]:
-        if self.difficulty == "easy":
-            return [w for w in word_list if 3 <= len(w) <= 4]
-        elif self.difficulty == "medium":
-            return [w for w in word_list if 5 <= len(w) <= 7]
-        elif self.difficulty == "hard":
-            return [w for w in word_list if len(w) >= 8]
-        elif self.difficulty == "random":
-            return word_list
-        else:
-            return word_list
+    def _build_buckets(self, word_list: list[bytes]) -> dict[str, list[bytes]]:
+        buckets = {diff_level: [] for diff_level in self._RANGES}
+        bucket_by_length = {
+            length: buckets[diff_level]
+            for diff_level, (lo, hi) in self._RANGES.items()
+            for length in range(lo, hi + 1)
+        }
+        for w in word_list:
+            bucket = bucket_by_length.get(len(w))
+            if bucket is not None:
+                bucket.append(w)
+        buckets["random"] = word_list
+        return buckets
+
+    def _filter_words(self) -> list[bytes]:
+        return self._buckets.get(self.difficulty, self.all_words)
 
     def load(self) -> str:
-        filtered_list = self._filter_words(self.all_words)
+        filtered_list = self._filter_words()
 
         if not filtered_list:
             difficulty_msg = (
                 f"'{self.difficulty}'" if self.difficulty != "random" else "any"
             )
-            print(f"Error: No words found matching {difficulty_msg} criteria.")
+            log.error("No words found matching %s criteria.", difficulty_msg)
             return ""
 
         available_count = len(filtered_list)
         count_to_sample = min(self.word_count, available_count)
 
         if count_to_sample <= 0:
-            print(f"Error: No words to sample for difficulty '{self.difficulty}'.")
+            log.error("No words to sample for difficulty '%s'.", self.difficulty)
             return ""
         if count_to_sample < self.word_count and available_count < self.word_count:
-            print(
-                f"Warning: Only {available_count} words matching criteria for "
-                f"'{self.difficulty}', using {count_to_sample}."
+            log.warning(
+                "Only %d words matching criteria for '%s', using %d.",
+                available_count,
+                self.difficulty,
+                count_to_sample,
             )
 
         try:
-            selected_words = random.sample(filtered_list, count_to_sample)
-            return " ".join(selected_words)
+            return self._sample_text(filtered_list, count_to_sample)
         except ValueError as e:
-            print(f"Error sampling words: {e}")
+            log.error("Error sampling words: %s", e)
             return ""
 
 
@@ -142,54 +216,192 @@ class LocalFolderWordLoader(TextLoader):
     ):
         super().__init__(difficulty, word_count)
         self.folder_path = folder_path
-        self.words_by_difficulty: dict[str, list[str]] = self._read_words_from_files()
-        if not any(self.words_by_difficulty.values()):
+        self._cache_path = os.path.join(folder_path, WORD_CACHE_FILENAME)
+        self._cache: dict | None = None
+        self._files = {
+            diff_level: os.path.join(folder_path, filename)
+            for diff_level, filename in WORD_FILES.items()
+        }
+        self._combined_cache: list[bytes] | None = None
+        # Word lists are read on first use; None marks a level not loaded yet.
+        self.words_by_difficulty = {diff_level: None for diff_level in self._files}
+        if not any(
+            os.path.isfile(file_path)
+            or os.path.isfile(pack_paths(folder_path, diff_level)[0])
+            for diff_level, file_path in self._files.items()
+        ):
             raise FileNotFoundError(
-                f"No word files found or files are empty in '{self.folder_path}'. "
+                f"No word files found in '{self.folder_path}'. "
                 "Expected easy.txt, medium.txt, hard.txt."
             )
-        print(f"Word source ready: Loaded words from folder '{self.folder_path}'.")
-
-    def _read_words_from_files(self) -> dict[str, list[str]]:
-        word_map = {"easy": [], "medium": [], "hard": []}
-        expected_files = {
-            "easy": "easy.txt",
-            "medium": "medium.txt",
-            "hard": "hard.txt",
-        }
-        print(f"Attempting to load words from folder: {self.folder_path}")
-        for diff_level, filename in expected_files.items():
-            file_path = os.path.join(self.folder_path, filename)
-            try:
-                with open(file_path, "r", encoding="utf-8") as f:
-                    words = [
-                        line.strip().lower()
-                        for line in f
-                        if line.strip() and line.strip().isalpha()
-                    ]
-                    word_map[diff_level] = list(set(words))
-                    count = len(word_map[diff_level])
-                    print(f"  - Loaded {count} words from '{filename}'.")
-            except FileNotFoundError:
-                print(f"  - Warning: File not found: '{file_path}'")
-            except IOError as e:
-                print(f"  - Error reading file '{file_path}': {e}")
-            except Exception as e:
-                print(f"  - Unexpected error processing file '{file_path}': {e}")
-        return word_map
+        log.debug("Word source ready: Using words from folder '%s'.", folder_path)
+
+    @property
+    def words_by_difficulty(self) -> dict[str, list[bytes] | None]:
+        return self._words_by_difficulty
+
+    @words_by_difficulty.setter
+    def words_by_difficulty(self, word_map: dict[str, list[bytes] | None]):
+        self._words_by_difficulty = word_map
+        self._invalidate_cache()
+
+    def _invalidate_cache(self):
+        self._combined_cache = None
+
+    def _get_combined_words(self) -> list[bytes]:
+        if self._combined_cache is None:
+            self._load_levels(list(self.words_by_difficulty))
+            self._combined_cache = list(
+                {w for key in self.words_by_difficulty for w in self._get_words(key)}
+            )
+        return self._combined_cache
+
+    def _get_words(self, diff_level: str) -> list[bytes]:
+        if diff_level not in self.words_by_difficulty:
+            return []
+        if self.words_by_difficulty[diff_level] is None:
+            self._load_levels([diff_level])
+        return self.words_by_difficulty[diff_level]
+
+    def _load_levels(self, diff_levels: list[str]):
+        missing = [
+            diff_level
+            for diff_level in diff_levels
+            if self.words_by_difficulty.get(diff_level, []) is None
+        ]
+        if not missing:
+            return
+        cache = self._read_cache()
+        if len(missing) == 1:
+            results = [self._read_one(missing[0])]
+        else:
+            # File reads release the GIL, so the levels load concurrently.
+            with ThreadPoolExecutor(max_workers=len(missing)) as executor:
+                results = list(executor.map(self._read_one, missing))
+
+        cache_changed = False
+        for diff_level, words, signature in results:
+            self.words_by_difficulty[diff_level] = words
+            if signature is not None:
+                cache[diff_level] = (signature, words)
+                cache_changed = True
+        if cache_changed:
+            self._write_cache(cache)
+
+    def _read_one(self, diff_level: str) -> tuple[str, list[bytes], tuple | None]:
+        """Reads one level; the signature is returned only for fresh file reads."""
+        pack = self._open_word_pack(diff_level)
+        if pack is not None:
+            log.debug("Using word pack for '%s' (%d words).", diff_level, len(pack))
+            return diff_level, pack, None
+        signature = self._file_signature(diff_level)
+        cached = self._read_cache().get(diff_level)
+        if signature is not None and cached and cached[0] == signature:
+            return diff_level, cached[1], None
+        words = self._read_words_from_file(diff_level)
+        if signature is None or not words:
+            return diff_level, words, None
+        return diff_level, words, signature
+
+    def _open_word_pack(self, diff_level: str) -> WordPack | None:
+        pack_path, index_path = pack_paths(self.folder_path, diff_level)
+        try:
+            pack_mtime = os.stat(pack_path).st_mtime_ns
+        except FileNotFoundError:
+            return None
+        try:
+            if os.stat(self._files[diff_level]).st_mtime_ns > pack_mtime:
+                log.warning("Word pack '%s' is out of date.", pack_path)
+                return None
+        except FileNotFoundError:
+            pass
+        try:
+            return WordPack(pack_path, index_path)
+        except (OSError, ValueError) as e:
+            log.error("Error reading word pack '%s': %s", pack_path, e)
+            return None
+
+    def _file_signature(self, diff_level: str) -> tuple[int, int] | None:
+        try:
+            stat = os.stat(self._files[diff_level])
+        except OSError:
+            return None
+        return stat.st_mtime_ns, stat.st_size
+
+    def _read_cache(self) -> dict:
+        if self._cache is not None:
+            return self._cache
+        self._cache = {"version": WORD_CACHE_VERSION}
+        try:
+            with open(self._cache_path, "rb") as f:
+                cached = pickle.load(f)
+            if isinstance(cached, dict) and cached.get("version") == WORD_CACHE_VERSION:
+                self._cache = cached
+        except FileNotFoundError:
+            pass
+        except (pickle.UnpicklingError, EOFError, OSError, ValueError) as e:
+            log.warning("Ignoring unreadable word cache: %s", e)
+        return self._cache
+
+    def _write_cache(self, cache: dict):
+        tmp_path = self._cache_path + ".tmp"
+        try:
+            with open(tmp_path, "wb") as f:
+                pickle.dump(cache, f, protocol=pickle.HIGHEST_PROTOCOL)
+            os.replace(tmp_path, self._cache_path)
+        except OSError as e:
+            log.warning("Could not write word cache: %s", e)
+
+    def _read_words_from_file(self, diff_level: str) -> list[bytes]:
+        file_path = self._files[diff_level]
+        try:
+            words = self._read_word_file(file_path)
+            # Curated word lists rarely repeat, so a sort plus an adjacent
+            # dedup beats hashing every word into a set and keeps the order
+            # deterministic.
+            words.sort()
+            unique = words[:1]
+            append = unique.append
+            last = unique[0] if unique else None
+            for w in words:
+                if w != last:
+                    append(w)
+                    last = w
+            words = unique
+            log.debug("Loaded %d words from '%s'.", len(words), file_path)
+            return words
+        except FileNotFoundError:
+            log.warning("File not found: '%s'", file_path)
+        except IOError as e:
+            log.error("Error reading file '%s': %s", file_path, e)
+        except Exception as e:
+            log.error("Unexpected error processing file '%s': %s", file_path, e)
+        return []
+
+    def _read_word_file(self, file_path: str) -> list[bytes]:
+        fd = os.open(file_path, os.O_RDONLY)
+        try:
+            if os.fstat(fd).st_size <= MMAP_MIN_SIZE:
+                with open(fd, "rb", closefd=False) as f:
+                    data = f.read()
+            else:
+                with mmap.mmap(fd, 0, access=mmap.ACCESS_READ) as mm:
+                    data = mm.read()
+        finally:
+            os.close(fd)
+        # lower() and split() each run as a single C pass over the buffer;
+        # bytes.isalpha() only accepts ASCII letters, so words stay undecoded.
+        return [token for token in data.lower().split() if token.isalpha()]
 
     def load(self) -> str:
-        word_list = []
         if self.difficulty == "random":
-            for key in self.words_by_difficulty:
-                word_list.extend(self.words_by_difficulty[key])
-            word_list = list(set(word_list))
-            print(f"Info: Using combined list ({len(word_list)} words) for 'random'.")
+            word_list = self._get_combined_words()
+            log.debug("Using combined list (%d words) for 'random'.", len(word_list))
         else:
-            word_list = self.words_by_difficulty.get(self.difficulty, [])
+            word_list = self._get_words(self.difficulty)
 
         if not word_list:
-            print(f"Error: No words available for difficulty '{self.difficulty}'.")
+            log.error("No words available for difficulty '%s'.", self.difficulty)
             return ""
 
         available_count = len(word_list)
@@ -198,14 +410,15 @@ class LocalFolderWordLoader(TextLoader):
         if count_to_sample <= 0:
             return ""
         if count_to_sample < self.word_count:
-            print(
-                f"Warning: Only {available_count} words available for "
-                f"'{self.difficulty}', using {count_to_sample}."
+            log.warning(
+                "Only %d words available for '%s', using %d.",
+                available_count,
+                self.difficulty,
+                count_to_sample,
             )
 
         try:
-            selected_words = random.sample(word_list, count_to_sample)
-            return " ".join(selected_words)
+            return self._sample_text(word_list, count_to_sample)
         except ValueError as e:
-            print(f"Error sampling words: {e}")
+            log.error("Error sampling words: %s", e)
             return ""
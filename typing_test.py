@@ -1,11 +1,23 @@
 import curses
+import os
+import queue
+import threading
 import time
 from datetime import datetime
+from typing import TextIO
 
 from text_loader import TextLoader
 
 from config import RESULTS_FILENAME, ESCAPE_KEY, BACKSPACE_CODES
-from utils import calculate_wpm, calculate_accuracy
+from render import build_layout, paint_text
+from utils import calculate_wpm_ns, calculate_accuracy
+
+NS_PER_SECOND = 1_000_000_000
+# Floor for the elapsed time used in live WPM, so the first keystroke
+# does not divide by (almost) zero.
+MIN_ELAPSED_NS = NS_PER_SECOND // 10
+# Screen row of the first line of the passage.
+TEXT_START_ROW = 3
 
 
 class TypingTest:
@@ -13,23 +25,75 @@ class TypingTest:
         self.stdscr = stdscr
         self.text_loader = text_loader
         self.target_text: str = ""
-        self.current_text: list[str] = []
+        # Typed keys and the target are kept as ASCII byte codes so the hot
+        # loop compares ints instead of building one-character strings.
+        # _typed is sized to the target once per test and only the first
+        # _typed_len cells are live, so keystrokes never resize it. _correct
+        # holds 1 per live cell that matched the target, set at key time.
+        self._target_bytes: bytes = b""
+        self._typed: bytearray = bytearray()
+        self._correct: bytearray = bytearray()
+        self._typed_len: int = 0
         self.wpm: int = 0
-        self.start_time: float = 0.0
+        self.start_time_ns: int = 0
         self.word_count: int = getattr(text_loader, "word_count", 25)
         self.difficulty: str = getattr(text_loader, "difficulty", "medium")
         self.has_started_typing: bool = False
         self.errors: int = 0
+        # Render state for _display_test_ui; _rendered_len None forces a
+        # full redraw and _dirty_from is the first typed cell changed since.
+        self._rendered_len: int | None = None
+        self._rendered_header: tuple | None = None
+        self._dirty_from: int = 0
+        self._wpm_key: tuple[int, int] | None = None
+        # Screen size during a test and the passage's cell layout for it,
+        # both rebuilt only at test start and on KEY_RESIZE.
+        self._max_y: int = 0
+        self._max_x: int = 0
+        self._layout: tuple[list[int], list[int], list[int]] = ([], [], [])
+        self._hdr_diff: str = ""
+        self._hdr_words: str = ""
+        # Attribute for each color pair number, filled in by _init_colors, so
+        # drawing indexes a list instead of calling curses.color_pair().
+        self._attr: list[int] = [0] * 6
+        self._error_attr: int = curses.A_BOLD
+        # Key handler per curses key code; see _build_dispatch.
+        self._dispatch = self._build_dispatch()
+        self._diff_pad = None
+        self._results_file: TextIO | None = None
+        self._results_queue: queue.Queue[str | None] = queue.Queue()
+        self._results_writer: threading.Thread | None = None
+
+    def _build_static_pads(self):
+        """Pre-renders the fixed difficulty menu into an off-screen pad."""
+        lines = [
+            (0, "Select difficulty:"),
+            (2, "1. Easy"),
+            (3, "2. Medium"),
+            (4, "3. Hard"),
+            (5, "4. Random (Mixed Lengths)"),
+            (7, "Press 1, 2, 3, or 4 (ESC to quit): "),
+        ]
+        width = max(len(text) for _, text in lines) + 1
+        self._diff_pad = curses.newpad(lines[-1][0] + 1, width)
+        for row, text in lines:
+            self._diff_pad.addstr(row, 0, text)
+
+    def _blit_pad(self, pad):
+        """Copies a pre-rendered pad onto the cleared screen, clipped to fit."""
+        self.stdscr.clear()
+        max_y, max_x = self.stdscr.getmaxyx()
+        pad_y, pad_x = pad.getmaxyx()
+        rows, cols = min(pad_y, max_y), min(pad_x, max_x)
+        if rows > 0 and cols > 0:
+            pad.overwrite(self.stdscr, 0, 0, 0, 0, rows - 1, cols - 1)
+        self.stdscr.noutrefresh()
+        curses.doupdate()
 
     def _show_difficulty_screen(self) -> str:
-        self.stdscr.clear()
-        self.stdscr.addstr(0, 0, "Select difficulty:")
-        self.stdscr.addstr(2, 0, "1. Easy")
-        self.stdscr.addstr(3, 0, "2. Medium")
-        self.stdscr.addstr(4, 0, "3. Hard")
-        self.stdscr.addstr(5, 0, "4. Random (Mixed Lengths)")
-        self.stdscr.addstr(7, 0, "Press 1, 2, 3, or 4 (ESC to quit): ")
-        self.stdscr.refresh()
+        if self._diff_pad is None:
+            self._build_static_pads()
+        self._blit_pad(self._diff_pad)
         while True:
             try:
                 key = self.stdscr.getkey()
@@ -42,11 +106,8 @@ class TypingTest:
             except (TypeError, ValueError, curses.error, SystemExit) as e:
                 if isinstance(e, SystemExit):
                     raise
-                self.stdscr.clear()
-                # Simplified redraw on error
-                self.stdscr.addstr(0, 0, "Select difficulty (error/resized?):")
-                self.stdscr.addstr(6, 0, "Press 1, 2, 3, or 4 (ESC to quit): ")
-                self.stdscr.refresh()
+                # Redraw on error (e.g. resize) is a single blit of the pad.
+                self._blit_pad(self._diff_pad)
                 continue
 
     def _show_word_count_screen(self) -> int:
@@ -55,13 +116,16 @@ class TypingTest:
         prompt = "Enter number (ESC to quit): "
         prompt_row = 2
         self.stdscr.addstr(prompt_row, 0, prompt)
-        self.stdscr.refresh()
         input_str = ""
         input_start_col = len(prompt)
         curses.curs_set(1)
         while True:
             try:
+                # Each pass stages the edit and cursor move, then flushes them
+                # in a single doupdate() before blocking on the next key.
                 self.stdscr.move(prompt_row, input_start_col + len(input_str))
+                self.stdscr.noutrefresh()
+                curses.doupdate()
                 key_code = self.stdscr.getch()
                 if key_code == ESCAPE_KEY:
                     raise SystemExit()
@@ -78,12 +142,10 @@ class TypingTest:
                     if len(input_str) < 2:
                         input_str += chr(key_code)
                         self.stdscr.addch(key_code)
-                self.stdscr.refresh()
             except curses.error:
                 self.stdscr.clear()
                 self.stdscr.addstr(0, 0, "How many words? (5-50) (resized?)")
                 self.stdscr.addstr(prompt_row, 0, prompt + input_str)
-                self.stdscr.refresh()
                 continue
             except SystemExit:
                 raise
@@ -103,46 +165,49 @@ class TypingTest:
             print(f"Error: {e}")
             return
 
-        while True:
-            try:
-                self.difficulty = self._show_difficulty_screen()
-                self.word_count = self._show_word_count_screen()
-            except SystemExit:
-                break
-
-            if hasattr(self.text_loader, "set_options"):
-                self.text_loader.set_options(self.difficulty, self.word_count)
-            else:
-                self.text_loader.difficulty = self.difficulty
-                self.text_loader.word_count = self.word_count
+        try:
+            while True:
+                try:
+                    self.difficulty = self._show_difficulty_screen()
+                    self.word_count = self._show_word_count_screen()
+                except SystemExit:
+                    break
 
-            self.target_text = self.text_loader.load()
+                if hasattr(self.text_loader, "set_options"):
+                    self.text_loader.set_options(self.difficulty, self.word_count)
+                else:
+                    self.text_loader.difficulty = self.difficulty
+                    self.text_loader.word_count = self.word_count
 
-            if not self.target_text:
-                self._display_error("Error: Could not load text from loader.")
-                break
+                self.target_text = self.text_loader.load()
 
-            try:
-                self._show_start_screen()
-            except SystemExit:
-                break
+                if not self.target_text:
+                    self._display_error("Error: Could not load text from loader.")
+                    break
 
-            while True:
-                self.current_text = []
-                self.wpm = 0
-                self.start_time = 0.0
-                self.has_started_typing = False
-                self.errors = 0
                 try:
-                    self._run_test()
-                    should_retry_same = self._prompt_retry()
-                    if not should_retry_same:
-                        break
+                    self._show_start_screen()
                 except SystemExit:
-                    return
-                except curses.error:
-                    self._display_error("A window error occurred.")
-                    return
+                    break
+
+                while True:
+                    self._typed_len = 0
+                    self.wpm = 0
+                    self.start_time_ns = 0
+                    self.has_started_typing = False
+                    self.errors = 0
+                    try:
+                        self._run_test()
+                        should_retry_same = self._prompt_retry()
+                        if not should_retry_same:
+                            break
+                    except SystemExit:
+                        return
+                    except curses.error:
+                        self._display_error("A window error occurred.")
+                        return
+        finally:
+            self._close_results_file()
 
     def _init_colors(self):
         try:
@@ -153,6 +218,8 @@ class TypingTest:
             curses.init_pair(3, curses.COLOR_WHITE, -1)
             curses.init_pair(4, curses.COLOR_CYAN, -1)
             curses.init_pair(5, curses.COLOR_YELLOW, -1)
+            self._attr = [0] + [curses.color_pair(n) for n in range(1, 6)]
+            self._error_attr = self._attr[2] | curses.A_BOLD
         except curses.error as e:
             raise RuntimeError(f"Color setup failed: {e}.") from e
         except Exception as e:
@@ -160,12 +227,12 @@ class TypingTest:
 
     def _show_start_screen(self):
         self.stdscr.clear()
-        self.stdscr.addstr(0, 0, "Welcome!", curses.color_pair(3))
+        self.stdscr.addstr(0, 0, "Welcome!", self._attr[3])
         self.stdscr.addstr(
-            1, 0, f"Difficulty: {self.difficulty.capitalize()}", curses.color_pair(4)
+            1, 0, f"Difficulty: {self.difficulty.capitalize()}", self._attr[4]
         )
-        self.stdscr.addstr(2, 0, f"Word count: {self.word_count}", curses.color_pair(4))
-        self.stdscr.addstr(4, 0, "Press any key to begin!", curses.color_pair(3))
+        self.stdscr.addstr(2, 0, f"Word count: {self.word_count}", self._attr[4])
+        self.stdscr.addstr(4, 0, "Press any key to begin!", self._attr[3])
         self.stdscr.refresh()
         try:
             self.stdscr.nodelay(False)
@@ -173,143 +240,211 @@ class TypingTest:
         except curses.error:
             self._display_error("Input error before start. Exiting.")
 
-    def _display_test_ui(self, time_elapsed: float):
-        """Displays the main typing test interface."""
-        self.stdscr.erase()
-        max_y, max_x = self.stdscr.getmaxyx()
-        start_row = 3
+    def _display_test_ui(self, time_elapsed: float, max_y: int, max_x: int):
+        """Displays the main typing test interface, repainting only what changed."""
+        typed_len = self._typed_len
+
+        if self._rendered_len is None:
+            self.stdscr.erase()
+            self._rendered_header = None
+            self._draw_title_row(max_x)
+            dirty_start, dirty_end = 0, len(self.target_text)
+        else:
+            dirty_start = min(self._dirty_from, self._rendered_len)
+            dirty_end = max(self._rendered_len, typed_len)
+
+        time_val = f"{int(time_elapsed)}s" if self.has_started_typing else "Waiting..."
+        header = (self.errors, time_val, self.wpm if self.has_started_typing else 0)
+        if header != self._rendered_header:
+            self._draw_status_row(header, max_x)
+            self._rendered_header = header
+
+        paint_text(
+            self.stdscr,
+            self._target_bytes,
+            self._typed,
+            self._correct,
+            typed_len,
+            dirty_start,
+            dirty_end,
+            self._layout,
+            self._attr,
+        )
+        self._rendered_len = typed_len
+        self._dirty_from = typed_len
+
+        # ncurses already queues the whole frame in its own output buffer and
+        # emits it in one write on doupdate(); leaveok() additionally skips
+        # the cursor-positioning sequence when there is no cursor to show.
+        cursor_y, cursor_x = divmod(typed_len, max_x)
+        cursor_y += TEXT_START_ROW
+        show_cursor = typed_len < len(self.target_text) and cursor_y < max_y
+        self.stdscr.leaveok(not show_cursor)
+        if show_cursor:
+            try:
+                self.stdscr.move(cursor_y, cursor_x)
+            except curses.error:
+                pass
+        self.stdscr.noutrefresh()
+        curses.doupdate()
 
+    def _draw_title_row(self, max_x: int):
         try:
-            diff_str = f"Diff: {self.difficulty.capitalize()}"
-            word_str = f"Words: {self.word_count}"
-            err_str = f"Errors: {self.errors}"
-            time_val = (
-                f"{int(time_elapsed)}s" if self.has_started_typing else "Waiting..."
-            )
+            self.stdscr.addstr(0, 0, self._hdr_diff, self._attr[4])
+            col_after_diff = len(self._hdr_diff) + 2
+            if col_after_diff + len(self._hdr_words) < max_x:
+                self.stdscr.addstr(0, col_after_diff, self._hdr_words, self._attr[4])
+        except curses.error:
+            pass
+
+    def _draw_status_row(self, header: tuple, max_x: int):
+        errors, time_val, wpm = header
+        try:
+            self.stdscr.move(1, 0)
+            self.stdscr.clrtoeol()
+            err_str = f"Errors: {errors}"
             time_str_display = f"Time: {time_val}"
-            wpm_str_display = (
-                f"WPM: {self.wpm}" if self.has_started_typing else "WPM: 0"
-            )
-            self.stdscr.addstr(0, 0, diff_str, curses.color_pair(4))
-            col_after_diff = len(diff_str) + 2
-            if col_after_diff + len(word_str) < max_x:
-                self.stdscr.addstr(0, col_after_diff, word_str, curses.color_pair(4))
-            self.stdscr.addstr(1, 0, time_str_display, curses.color_pair(4))
+            wpm_str_display = f"WPM: {wpm}"
+            self.stdscr.addstr(1, 0, time_str_display, self._attr[4])
             errors_start_pos = len(time_str_display) + 2
             if errors_start_pos + len(err_str) < max_x:
-                self.stdscr.addstr(1, errors_start_pos, err_str, curses.color_pair(5))
+                self.stdscr.addstr(1, errors_start_pos, err_str, self._attr[5])
             wpm_start_pos = errors_start_pos + len(err_str) + 2
             if wpm_start_pos + len(wpm_str_display) < max_x:
-                self.stdscr.addstr(
-                    1, wpm_start_pos, wpm_str_display, curses.color_pair(3)
-                )
+                self.stdscr.addstr(1, wpm_start_pos, wpm_str_display, self._attr[3])
         except curses.error:
             pass
 
-        cursor_y, cursor_x = start_row, 0
-        if self.target_text:
-            line_y, line_x = start_row, 0
-            for i, target_char in enumerate(self.target_text):
-                if line_x >= max_x:
-                    line_y, line_x = line_y + 1, 0
-                if line_y >= max_y:
-                    break
-                display_char, color_pair_num = target_char, 3
-                if i < len(self.current_text):
-                    typed_char = self.current_text[i]
-                    display_char = typed_char
-                    color_pair_num = 1 if typed_char == target_char else 2
-                elif i == len(self.current_text):
-                    cursor_y, cursor_x = line_y, line_x
-                try:
-                    if line_y < max_y and line_x < max_x:
-                        self.stdscr.addstr(
-                            line_y,
-                            line_x,
-                            display_char,
-                            curses.color_pair(color_pair_num),
-                        )
-                except curses.error:
-                    pass
-                line_x += 1
-            if len(self.current_text) == len(self.target_text):
-                if line_x >= max_x:
-                    line_y += 1
-                    line_x = 0
-                if line_y < max_y:
-                    cursor_y, cursor_x = line_y, line_x
-
-        is_test_finished = len(self.current_text) == len(self.target_text)
-        if not is_test_finished and cursor_y < max_y and cursor_x < max_x:
-            try:
-                self.stdscr.move(cursor_y, cursor_x)
-            except curses.error:
-                pass
-        self.stdscr.refresh()
-
     def _run_test(self):
         if not self.target_text:
             raise ValueError("Target text is empty.")
-        self.stdscr.nodelay(True)
+        self._target_bytes = self.target_text.encode("ascii", "replace")
+        self._typed = bytearray(len(self._target_bytes))
+        self._correct = bytearray(len(self._target_bytes))
+        self._typed_len = 0
+        # The title row is fixed for the whole test, so format it once.
+        self._hdr_diff = f"Diff: {self.difficulty.capitalize()}"
+        self._hdr_words = f"Words: {self.word_count}"
         curses.curs_set(1)
+        self._rendered_len = None
+        self._wpm_key = None
+        self._update_layout()
         while True:
-            current_time = time.time()
-            time_elapsed = 0.0
+            elapsed_ns = 0
             if self.has_started_typing:
-                time_elapsed = max(0.1, current_time - self.start_time)
-                self.wpm = calculate_wpm(len(self.current_text), time_elapsed)
+                elapsed_ns = max(
+                    MIN_ELAPSED_NS, time.monotonic_ns() - self.start_time_ns
+                )
+                # The header shows whole seconds, so WPM only needs
+                # recomputing when the length or the displayed second changes.
+                wpm_key = (self._typed_len, elapsed_ns // NS_PER_SECOND)
+                if wpm_key != self._wpm_key:
+                    self._wpm_key = wpm_key
+                    self.wpm = calculate_wpm_ns(wpm_key[0], elapsed_ns)
             else:
                 self.wpm = 0
 
             try:
-                self._display_test_ui(time_elapsed)
+                self._display_test_ui(
+                    elapsed_ns / NS_PER_SECOND, self._max_y, self._max_x
+                )
             except curses.error:
                 pass
 
-            if len(self.current_text) == len(self.target_text):
-                self.stdscr.nodelay(False)
+            if self._typed_len == len(self._target_bytes):
+                self.stdscr.timeout(-1)
+                self.stdscr.leaveok(False)
                 curses.curs_set(0)
                 break
 
+            # Block until the first key; once the timer runs, getch() wakes at
+            # each whole second so the time/WPM header keeps ticking. curses
+            # waits on the tty itself, so keys wake the loop immediately.
+            if self.has_started_typing:
+                next_tick_ns = (elapsed_ns // NS_PER_SECOND + 1) * NS_PER_SECOND
+                wait_ns = self.start_time_ns + next_tick_ns - time.monotonic_ns()
+                self.stdscr.timeout(max(1, -(-wait_ns // 1_000_000)))
+            else:
+                self.stdscr.timeout(-1)
+
             try:
                 key_code = self.stdscr.getch()
-                if key_code == -1:
-                    time.sleep(0.01)
-                    continue
-                key = chr(key_code) if 32 <= key_code <= 126 else key_code
             except curses.error:
-                time.sleep(0.01)
                 continue
 
-            is_printable = isinstance(key, str)
-            if (
-                not self.has_started_typing
-                and is_printable
-                and key_code != ESCAPE_KEY
-                and key_code not in BACKSPACE_CODES
-            ):
-                self.has_started_typing = True
-                self.start_time = time.time()
-
-            if key_code == ESCAPE_KEY:
-                raise SystemExit()
-
-            if key_code in BACKSPACE_CODES:
-                if self.current_text:
-                    removed_idx = len(self.current_text) - 1
-                    if (
-                        removed_idx < len(self.target_text)
-                        and self.current_text[removed_idx]
-                        != self.target_text[removed_idx]
-                    ):
-                        self.errors = max(0, self.errors - 1)
-                    self.current_text.pop()
-            elif is_printable:
-                if len(self.current_text) < len(self.target_text):
-                    target_char = self.target_text[len(self.current_text)]
-                    if key != target_char:
-                        self.errors += 1
-                    self.current_text.append(key)
+            if key_code != -1:
+                self._drain_input(key_code)
+
+    def _drain_input(self, key_code: int):
+        """Applies key_code plus any keys already queued, e.g. from a paste.
+
+        Everything pending is processed before the next render, so a paste
+        costs one redraw instead of one per character. The drain is capped
+        at the passage length to bound the time between frames.
+        """
+        self._process_key(key_code)
+        self.stdscr.timeout(0)
+        for _ in range(len(self._target_bytes) - 1):
+            if self._typed_len == len(self._target_bytes):
+                return
+            try:
+                key_code = self.stdscr.getch()
+            except curses.error:
+                return
+            if key_code == -1:
+                return
+            self._process_key(key_code)
+
+    def _build_dispatch(self) -> list:
+        """Maps every curses key code to its handler, for one-index dispatch."""
+        table = [self._on_noop] * (curses.KEY_MAX + 1)
+        for code in range(32, 127):
+            table[code] = self._on_printable
+        for code in BACKSPACE_CODES:
+            table[code] = self._on_backspace
+        table[ESCAPE_KEY] = self._on_escape
+        table[curses.KEY_RESIZE] = self._on_resize
+        return table
+
+    def _process_key(self, key_code: int):
+        if 0 <= key_code <= curses.KEY_MAX:
+            self._dispatch[key_code](key_code)
+
+    def _on_noop(self, key_code: int):
+        pass
+
+    def _on_escape(self, key_code: int):
+        raise SystemExit()
+
+    def _on_resize(self, key_code: int):
+        self._update_layout()
+        self._rendered_len = None
+
+    def _update_layout(self):
+        self._max_y, self._max_x = self.stdscr.getmaxyx()
+        self._layout = build_layout(
+            len(self._target_bytes), TEXT_START_ROW, self._max_y, self._max_x
+        )
+
+    def _on_backspace(self, key_code: int):
+        if self._typed_len:
+            self._typed_len -= 1
+            removed_idx = self._typed_len
+            if not self._correct[removed_idx]:
+                self.errors = max(0, self.errors - 1)
+            self._dirty_from = min(self._dirty_from, removed_idx)
+
+    def _on_printable(self, key_code: int):
+        if not self.has_started_typing:
+            self.has_started_typing = True
+            self.start_time_ns = time.monotonic_ns()
+        if self._typed_len < len(self._target_bytes):
+            ok = key_code == self._target_bytes[self._typed_len]
+            if not ok:
+                self.errors += 1
+            self._typed[self._typed_len] = key_code
+            self._correct[self._typed_len] = ok
+            self._typed_len += 1
 
     def _save_results_to_file(
         self, wpm: int, accuracy: float, time_taken: float, errors: int
@@ -320,16 +455,55 @@ class TypingTest:
             f"Word count: {self.word_count}, WPM: {wpm}, "
             f"Accuracy: {accuracy}%, Errors: {errors}, Time: {int(time_taken)}"
         )
+        # The write happens on a background thread so a slow disk never
+        # stalls the results screen.
+        if self._results_writer is None:
+            self._results_writer = threading.Thread(
+                target=self._write_results, daemon=True
+            )
+            self._results_writer.start()
+        self._results_queue.put(result_line)
+
+    def _write_results(self):
+        """Appends queued result lines until a None sentinel arrives."""
+        while True:
+            result_line = self._results_queue.get()
+            if result_line is None:
+                break
+            try:
+                # Opened on first use and kept open (line-buffered) for the session.
+                if self._results_file is None:
+                    self._results_file = open(
+                        RESULTS_FILENAME, "a", encoding="utf-8", buffering=1
+                    )
+                self._results_file.write(result_line + "\n")
+            except (IOError, OSError) as e:
+                print(f"\nError writing results: {e}")
+            except Exception as e:
+                print(f"\nUnexpected error writing results: {e}")
+
+        if self._results_file is None:
+            return
         try:
-            with open(RESULTS_FILENAME, "a", encoding="utf-8") as f:
-                f.write(result_line + "\n")
-        except (IOError, OSError) as e:
-            print(f"\nError writing results: {e}")
-        except Exception as e:
-            print(f"\nUnexpected error writing results: {e}")
+            self._results_file.flush()
+            os.fsync(self._results_file.fileno())
+        except OSError as e:
+            print(f"\nError flushing results: {e}")
+        finally:
+            self._results_file.close()
+            self._results_file = None
+
+    def _close_results_file(self):
+        if self._results_writer is None:
+            return
+        self._results_queue.put(None)
+        self._results_writer.join()
+        self._results_writer = None
 
     def _prompt_retry(self) -> bool:
-        time_taken = time.time() - self.start_time if self.has_started_typing else 0.0
+        time_taken = 0.0
+        if self.has_started_typing:
+            time_taken = (time.monotonic_ns() - self.start_time_ns) / NS_PER_SECOND
         accuracy = 0.0
         target_len = len(self.target_text)
         if target_len > 0:
@@ -364,20 +538,14 @@ class TypingTest:
 
             self.stdscr.addstr(results_start_row, 0, title, curses.A_BOLD)
             if results_start_row + 1 < max_y:
-                self.stdscr.addstr(
-                    results_start_row + 1, 0, res_line1, curses.color_pair(3)
-                )
+                self.stdscr.addstr(results_start_row + 1, 0, res_line1, self._attr[3])
             if prompt_row < max_y:
-                self.stdscr.addstr(prompt_row, 0, prompt, curses.color_pair(3))
+                self.stdscr.addstr(prompt_row, 0, prompt, self._attr[3])
             else:
-                self.stdscr.addstr(
-                    max_y - 1, 0, "R:Retry|N:New|Quit?", curses.color_pair(3)
-                )
+                self.stdscr.addstr(max_y - 1, 0, "R:Retry|N:New|Quit?", self._attr[3])
         except curses.error:
             try:
-                self.stdscr.addstr(
-                    max_y - 1, 0, "R:Retry|N:New|Quit?", curses.color_pair(3)
-                )
+                self.stdscr.addstr(max_y - 1, 0, "R:Retry|N:New|Quit?", self._attr[3])
             except curses.error:
                 pass
 
@@ -408,9 +576,7 @@ class TypingTest:
                 self.stdscr.clear()
                 max_y, max_x = self.stdscr.getmaxyx()
                 if max_y > 0 and max_x > 0:
-                    self.stdscr.addstr(
-                        0, 0, message, curses.color_pair(2) | curses.A_BOLD
-                    )
+                    self.stdscr.addstr(0, 0, message, self._error_attr)
                 if max_y > 2 and max_x > 0:
                     self.stdscr.addstr(2, 0, "Press any key to exit.")
                 self.stdscr.refresh()
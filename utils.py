@@ -1,16 +1,21 @@
 def calculate_wpm(chars_typed: int, time_elapsed_seconds: float) -> int:
     """Calculates Words Per Minute (WPM)."""
+    # (chars / 5) / (seconds / 60) folded into a single constant.
     if time_elapsed_seconds <= 0:
         return 0
-    wpm_raw = (chars_typed / 5) / (time_elapsed_seconds / 60)
-    return round(wpm_raw)
+    return round(chars_typed * 12.0 / time_elapsed_seconds)
+
+
+def calculate_wpm_ns(chars_typed: int, elapsed_ns: int) -> int:
+    """Calculates WPM from an integer nanosecond duration using integer math."""
+    if elapsed_ns <= 0:
+        return 0
+    # (chars / 5) / (ns / 60e9) == chars * 12e9 / ns, rounded half up.
+    return (chars_typed * 24_000_000_000 + elapsed_ns) // (2 * elapsed_ns)
 
 
 def calculate_accuracy(target_len: int, errors: int) -> float:
     """Calculates typing accuracy percentage."""
     if target_len <= 0:
         return 0.0
-    actual_errors = min(errors, target_len)
-    correct_chars = target_len - actual_errors
-    accuracy = (correct_chars / target_len) * 100
-    return round(accuracy, 1)
+    return round((target_len - min(errors, target_len)) * 100 / target_len, 1)
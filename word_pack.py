@@ -0,0 +1,93 @@
+from array import array
+from collections.abc import Sequence
+import mmap
+import os
+import sys
+
+PACK_SUFFIX = ".pack"
+INDEX_SUFFIX = ".idx"
+MAX_WORD_BYTES = 255
+
+
+class WordPack(Sequence):
+    """Read-only word list backed by a memory-mapped pack file.
+
+    A pack holds ``<u8 length><ASCII bytes>`` records back to back; the
+    index file holds the little-endian u32 offset of every record. Words
+    are returned as ``bytes``, matching the loaders' in-memory word lists.
+    """
+
+    def __init__(self, pack_path: str, index_path: str):
+        self.offsets = array("I")
+        with open(index_path, "rb") as f:
+            self.offsets.frombytes(f.read())
+        if sys.byteorder == "big":
+            self.offsets.byteswap()
+        self._mmap: mmap.mmap | None = None
+        if self.offsets:
+            with open(pack_path, "rb") as f:
+                self._mmap = mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ)
+        self._buf = memoryview(self._mmap) if self._mmap is not None else None
+
+    def __len__(self) -> int:
+        return len(self.offsets)
+
+    def __getitem__(self, index):
+        if isinstance(index, slice):
+            return [self[i] for i in range(*index.indices(len(self)))]
+        start = self.offsets[index] + 1
+        end = start + self._buf[start - 1]
+        return self._buf[start:end].tobytes()
+
+    def close(self):
+        if self._mmap is not None:
+            self._buf.release()
+            self._mmap.close()
+            self._mmap = None
+
+
+def pack_paths(folder_path: str, level: str) -> tuple[str, str]:
+    base = os.path.join(folder_path, level)
+    return base + PACK_SUFFIX, base + INDEX_SUFFIX
+
+
+def write_word_pack(words: list[bytes], pack_path: str, index_path: str) -> int:
+    offsets = array("I")
+    data = bytearray()
+    for word in words:
+        if not word or len(word) > MAX_WORD_BYTES:
+            continue
+        offsets.append(len(data))
+        data.append(len(word))
+        data += word
+    if sys.byteorder == "big":
+        offsets.byteswap()
+    with open(pack_path, "wb") as f:
+        f.write(data)
+    with open(index_path, "wb") as f:
+        offsets.tofile(f)
+    return len(offsets)
+
+
+def build_word_packs(folder_path: str, word_files: dict[str, str]):
+    for level, filename in word_files.items():
+        words = set()
+        try:
+            with open(os.path.join(folder_path, filename), "rb") as f:
+                words.update(
+                    token for token in f.read().lower().split() if token.isalpha()
+                )
+        except FileNotFoundError:
+            print(f"  - Warning: File not found: '{filename}', writing empty pack.")
+        pack_path, index_path = pack_paths(folder_path, level)
+        count = write_word_pack(sorted(words), pack_path, index_path)
+        print(f"  - Packed {count} words into '{pack_path}'.")
+
+
+if __name__ == "__main__":
+    from config import DEFAULT_WORD_LIST_FOLDER
+    from text_loader import WORD_FILES
+
+    folder = sys.argv[1] if len(sys.argv) > 1 else DEFAULT_WORD_LIST_FOLDER
+    print(f"Building word packs in folder: {folder}")
+    build_word_packs(folder, WORD_FILES)